@@ -1,5 +1,5 @@
-import inspect
 import os
+import sys
 from typing import AnyStr, Union
 
 
@@ -11,10 +11,10 @@ def get_caller_filepath(steps_back: int = 2) -> AnyStr:
         the caller of this function. Defaults to 2, i.e. the path of the file of the
         caller of this function's caller.
     """
-    frame_info = inspect.stack()[steps_back]
-    filepath = frame_info.filename
-    del frame_info
-    return os.path.abspath(filepath)
+    frame = sys._getframe(steps_back)
+    filename = frame.f_code.co_filename
+    del frame
+    return os.path.abspath(filename)
 
 
 def get_dependency_name(dependency: Union[type, callable, str]) -> str:
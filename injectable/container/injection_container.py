@@ -1,7 +1,8 @@
 import os
+import sys
 import warnings
 from runpy import run_path, run_module
-from typing import Dict, List, Optional, Callable
+from typing import Dict, FrozenSet, Optional, Callable
 from typing import Set
 
 from pycollect import PythonFileCollector, module_finder
@@ -36,7 +37,8 @@ class InjectionContainer:
     LOADING_FILEPATH: Optional[str] = None
     LOADED_FILEPATHS: Set[str] = set()
     NAMESPACES: Dict[str, Namespace] = {}
-    GROUPS: Optional[List[str]] = None
+    GROUPS: Optional[FrozenSet[str]] = None
+    _VERSION: int = 0
 
     def __new__(cls):
         raise NotImplementedError("InjectionContainer must not be instantiated")
@@ -106,11 +108,13 @@ class InjectionContainer:
         singleton: bool = False,
     ):
         unique_id = f"{klass.__qualname__}@{filepath}"
+        group = sys.intern(group) if group is not None else None
         injectable = Injectable(klass, unique_id, primary, group, singleton)
         namespace_entry = cls._get_namespace_entry(
             namespace or cls.LOADING_DEFAULT_NAMESPACE
         )
         namespace_entry.register_injectable(injectable, klass, qualifier)
+        cls._VERSION += 1
 
     @classmethod
     def _register_factory(
@@ -125,16 +129,19 @@ class InjectionContainer:
         singleton: bool = False,
     ):
         unique_id = f"{factory.__qualname__}@{filepath}"
+        group = sys.intern(group) if group is not None else None
         injectable = Injectable(factory, unique_id, primary, group, singleton)
         namespace_entry = cls._get_namespace_entry(
             namespace or cls.LOADING_DEFAULT_NAMESPACE
         )
         namespace_entry.register_injectable(injectable, dependency, qualifier)
+        cls._VERSION += 1
 
     @classmethod
     def _get_namespace_entry(cls, namespace: str) -> Namespace:
         if namespace not in cls.NAMESPACES:
             cls.NAMESPACES[namespace] = Namespace()
+            cls._VERSION += 1
         return cls.NAMESPACES[namespace]
 
     @classmethod
@@ -154,6 +161,7 @@ class InjectionContainer:
                 run_path(file.path)
             cls.LOADED_FILEPATHS.add(file.path)
             cls.LOADING_FILEPATH = None
+        cls._VERSION += 1
 
     @classmethod
     def load_dependencies_from(
@@ -165,7 +173,7 @@ class InjectionContainer:
     ):
         files = cls._collect_python_files(absolute_search_path)
         cls.LOADING_DEFAULT_NAMESPACE = default_namespace
-        cls.GROUPS = groups
+        cls.GROUPS = frozenset(groups) if groups else None
         if default_namespace not in cls.NAMESPACES:
             cls.NAMESPACES[default_namespace] = Namespace()
         for file in files:
@@ -183,6 +191,7 @@ class InjectionContainer:
             cls.LOADED_FILEPATHS.add(file.path)
             cls.LOADING_FILEPATH = None
         cls.LOADING_DEFAULT_NAMESPACE = None
+        cls._VERSION += 1
 
     @classmethod
     def _collect_python_files(cls, search_path) -> Set[os.DirEntry]:
@@ -1,4 +1,7 @@
 import os
+import sys
+from functools import lru_cache
+from typing import Optional
 
 from injectable.container.injection_container import InjectionContainer
 from injectable.common_utils import get_caller_filepath
@@ -42,11 +45,17 @@ def load_injection_container(
 
     .. versionadded:: 3.4.0
     """
-    if search_path is None:
-        search_path = os.path.dirname(get_caller_filepath())
-    elif not os.path.isabs(search_path):
-        caller_path = os.path.dirname(get_caller_filepath())
-        search_path = os.path.abspath(os.path.join(caller_path, search_path))
+    if search_path is None or not os.path.isabs(search_path):
+        search_path = _resolve_search_path(get_caller_filepath(), search_path)
+    groups = [sys.intern(group) for group in groups] if groups else None
     InjectionContainer.load_dependencies_from(
         search_path, default_namespace, groups, encoding
     )
+
+
+@lru_cache(maxsize=256)
+def _resolve_search_path(caller_filepath: str, search_path: Optional[str]) -> str:
+    caller_path = os.path.dirname(caller_filepath)
+    if search_path is None:
+        return caller_path
+    return os.path.abspath(os.path.join(caller_path, search_path))
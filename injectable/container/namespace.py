@@ -1,13 +1,40 @@
-from typing import Dict, Optional, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, Hashable, Optional
 
 from injectable.container.injectable import Injectable
 from injectable.common_utils import get_dependency_name
 
+_GROUP_BITS: Dict[str, int] = {}
+
+
+def get_group_bit(group: Optional[str]) -> int:
+    if group is None:
+        return 0
+    if group not in _GROUP_BITS:
+        _GROUP_BITS[group] = 1 << len(_GROUP_BITS)
+    return _GROUP_BITS[group]
+
+
+@lru_cache(maxsize=64)
+def get_groups_mask(groups: FrozenSet[str]) -> int:
+    mask = 0
+    for group in groups:
+        mask |= get_group_bit(group)
+    return mask
+
 
 class Namespace:
     def __init__(self):
-        self.class_registry: Dict[str, Set[Injectable]] = {}
-        self.qualifier_registry: Dict[str, Set[Injectable]] = {}
+        self.class_registry: Dict[str, Dict[Injectable, None]] = {}
+        self.qualifier_registry: Dict[str, Dict[Injectable, None]] = {}
+        self.class_group_registry: Dict[
+            str, Dict[Optional[str], Dict[Injectable, None]]
+        ] = {}
+        self.qualifier_group_registry: Dict[
+            str, Dict[Optional[str], Dict[Injectable, None]]
+        ] = {}
+        self.class_groups_mask: Dict[str, int] = {}
+        self.qualifier_groups_mask: Dict[str, int] = {}
 
     def register_injectable(
         self,
@@ -31,15 +58,44 @@ class Namespace:
         injectable: Injectable,
     ):
         qualified_name = get_dependency_name(klass)
-        if qualified_name not in self.class_registry:
-            self.class_registry[qualified_name] = set()
-        self.class_registry[qualified_name].add(injectable)
+        self._add_to_registry(self.class_registry, qualified_name, injectable)
+        self._register_to_group(self.class_group_registry, qualified_name, injectable)
+        self.class_groups_mask[qualified_name] = self.class_groups_mask.get(
+            qualified_name, 0
+        ) | get_group_bit(injectable.group)
 
     def _register_to_qualifier(
         self,
         qualifier: str,
         injectable: Injectable,
     ):
-        if qualifier not in self.qualifier_registry:
-            self.qualifier_registry[qualifier] = set()
-        self.qualifier_registry[qualifier].add(injectable)
+        self._add_to_registry(self.qualifier_registry, qualifier, injectable)
+        self._register_to_group(self.qualifier_group_registry, qualifier, injectable)
+        self.qualifier_groups_mask[qualifier] = self.qualifier_groups_mask.get(
+            qualifier, 0
+        ) | get_group_bit(injectable.group)
+
+    @classmethod
+    def _register_to_group(
+        cls,
+        group_registry: Dict[str, Dict[Optional[str], Dict[Injectable, None]]],
+        dependency_name: str,
+        injectable: Injectable,
+    ):
+        if dependency_name not in group_registry:
+            group_registry[dependency_name] = {}
+        cls._add_to_registry(
+            group_registry[dependency_name], injectable.group, injectable
+        )
+
+    @staticmethod
+    def _add_to_registry(
+        registry: Dict[Hashable, Dict[Injectable, None]],
+        key: Hashable,
+        injectable: Injectable,
+    ):
+        # registries are insertion ordered dicts used as ordered sets, lookups hand
+        # out tuple snapshots of them
+        if key not in registry:
+            registry[key] = {}
+        registry[key][injectable] = None
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Set
+from typing import Collection, Optional
 
 import injectable
 
@@ -13,7 +13,7 @@ class InjectionError(RuntimeError):
         self,
         registry_type: str,
         dependency_name: str,
-        matches: Set[injectable.Injectable] = None,
+        matches: Optional[Collection[injectable.Injectable]] = None,
     ):
         message = f"No injectable matches {registry_type} '{dependency_name}'."
         if matches:
@@ -4,8 +4,7 @@ from injectable.common_utils import get_dependency_name
 from injectable.errors import InjectionError
 from injectable.constants import DEFAULT_NAMESPACE
 from injectable.injection.injection_utils import (
-    get_namespace_injectables,
-    filter_by_group,
+    get_filtered_injectables,
     resolve_single_injectable,
     get_dependency_registry_type,
 )
@@ -74,17 +73,16 @@ def inject(
     """
     dependency_name = get_dependency_name(dependency)
     registry_type = get_dependency_registry_type(dependency)
-    matches = get_namespace_injectables(
-        dependency_name, registry_type, namespace or DEFAULT_NAMESPACE
+    matches = get_filtered_injectables(
+        dependency_name,
+        registry_type,
+        namespace or DEFAULT_NAMESPACE,
+        group,
+        exclude_groups,
     )
     if not matches:
         if not optional:
-            raise InjectionError(registry_type.value, dependency_name)
-        return None
-    matches = filter_by_group(matches, group, exclude_groups)
-    if not matches:
-        if not optional:
-            raise InjectionError(registry_type.value, dependency_name)
+            raise InjectionError(registry_type, dependency_name)
         return None
     injectable = resolve_single_injectable(dependency_name, registry_type, matches)
     return injectable.get_instance(lazy=lazy)
@@ -146,20 +144,15 @@ def inject_multiple(
     """
     dependency_name = get_dependency_name(dependency)
     registry_type = get_dependency_registry_type(dependency)
-    matches = get_namespace_injectables(
-        dependency_name, registry_type, namespace or DEFAULT_NAMESPACE
-    )
-    if not matches:
-        if not optional:
-            raise InjectionError(registry_type.value, dependency_name)
-        return []
-    matches = filter_by_group(
-        matches,
+    matches = get_filtered_injectables(
+        dependency_name,
+        registry_type,
+        namespace or DEFAULT_NAMESPACE,
         group,
         exclude_groups,
     )
     if not matches:
         if not optional:
-            raise InjectionError(registry_type.value, dependency_name)
+            raise InjectionError(registry_type, dependency_name)
         return []
     return [inj.get_instance(lazy=lazy) for inj in matches]
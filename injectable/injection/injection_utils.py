@@ -1,85 +1,241 @@
 import logging
-from enum import Enum
-from typing import Sequence, Set, Union, Type, TypeVar
+import threading
+from functools import lru_cache
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    Final,
+    FrozenSet,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    Type,
+    TypeVar,
+)
 
 from injectable.container.injection_container import InjectionContainer
 from injectable.container.injectable import Injectable
+from injectable.container.namespace import Namespace, get_groups_mask
 from injectable.errors import InjectionError
 
 T = TypeVar("T")
+RegistryType = Literal["class", "qualifier"]
+CLASS: Final[RegistryType] = "class"
+QUALIFIER: Final[RegistryType] = "qualifier"
+
+_EMPTY: Final[Tuple[Injectable, ...]] = ()
+_EMPTY_CONTAINER_WARNED: bool = False
+_NAMESPACE_CACHE: Final[threading.local] = threading.local()
+
+_REGISTRY_ATTRIBUTES: Final[Dict[RegistryType, str]] = {
+    CLASS: "class_registry",
+    QUALIFIER: "qualifier_registry",
+}
+_GROUP_REGISTRY_ATTRIBUTES: Final[Dict[RegistryType, str]] = {
+    CLASS: "class_group_registry",
+    QUALIFIER: "qualifier_group_registry",
+}
+_GROUPS_MASK_ATTRIBUTES: Final[Dict[RegistryType, str]] = {
+    CLASS: "class_groups_mask",
+    QUALIFIER: "qualifier_groups_mask",
+}
 
 
-class RegistryType(Enum):
-    CLASS = "class"
-    QUALIFIER = "qualifier"
+def get_dependency_registry_type(dependency: Union[Type[T], str]) -> RegistryType:
+    return QUALIFIER if isinstance(dependency, str) else CLASS
 
 
-def get_dependency_registry_type(dependency: Union[Type[T], str]) -> RegistryType:
-    return RegistryType.QUALIFIER if isinstance(dependency, str) else RegistryType.CLASS
+def _get_injection_namespace(namespace: str) -> Optional[Namespace]:
+    # each thread remembers its last resolved namespace, which is reused for as long
+    # as the container version and requested namespace don't change
+    version = InjectionContainer._VERSION
+    cached = getattr(_NAMESPACE_CACHE, "entry", None)
+    if cached is not None and cached[0] == version and cached[1] == namespace:
+        return cached[2]
+    injection_namespace = InjectionContainer.NAMESPACES.get(namespace)
+    _NAMESPACE_CACHE.entry = (version, namespace, injection_namespace)
+    return injection_namespace
 
 
 def get_namespace_injectables(
-    dependency_name: str, registry_type: RegistryType, namespace: str
-) -> Set[Injectable]:
-    if len(InjectionContainer.NAMESPACES) == 0:
+    dependency_name: str,
+    registry_type: RegistryType,
+    namespace: str,
+    group: Optional[str] = None,
+) -> Tuple[Injectable, ...]:
+    global _EMPTY_CONTAINER_WARNED
+    if not _EMPTY_CONTAINER_WARNED and not InjectionContainer.NAMESPACES:
+        _EMPTY_CONTAINER_WARNED = True
         logging.warning(
             "Injection Container is empty. Make sure 'load_injection_container'"
             " is being called before any injections are made."
         )
-    injection_namespace = InjectionContainer.NAMESPACES.get(namespace)
-    if not injection_namespace:
-        return set()
-    registry = (
-        injection_namespace.class_registry
-        if registry_type is RegistryType.CLASS
-        else injection_namespace.qualifier_registry
+    injection_namespace = _get_injection_namespace(namespace)
+    if injection_namespace is None:
+        return _EMPTY
+    if group is not None:
+        group_registry = getattr(
+            injection_namespace, _GROUP_REGISTRY_ATTRIBUTES[registry_type]
+        )
+        groups = group_registry.get(dependency_name)
+        injectables = groups.get(group) if groups else None
+    else:
+        registry = getattr(injection_namespace, _REGISTRY_ATTRIBUTES[registry_type])
+        injectables = registry.get(dependency_name)
+    return tuple(injectables) if injectables else _EMPTY
+
+
+def get_namespace_groups_mask(
+    dependency_name: str,
+    registry_type: RegistryType,
+    namespace: str,
+) -> int:
+    injection_namespace = _get_injection_namespace(namespace)
+    if injection_namespace is None:
+        return 0
+    groups_mask = getattr(injection_namespace, _GROUPS_MASK_ATTRIBUTES[registry_type])
+    return groups_mask.get(dependency_name, 0)
+
+
+def clear_injection_caches():
+    global _EMPTY_CONTAINER_WARNED
+    _EMPTY_CONTAINER_WARNED = False
+    _get_filtered_injectables.cache_clear()
+    vars(_NAMESPACE_CACHE).clear()
+
+
+def get_filtered_injectables(
+    dependency_name: str,
+    registry_type: RegistryType,
+    namespace: str,
+    group: Optional[str] = None,
+    exclude_groups: Optional[Sequence[str]] = None,
+) -> Tuple[Injectable, ...]:
+    return _get_filtered_injectables(
+        InjectionContainer._VERSION,
+        InjectionContainer.GROUPS,
+        dependency_name,
+        registry_type,
+        namespace,
+        group,
+        frozenset(exclude_groups) if exclude_groups else None,
     )
-    injectables = registry.get(dependency_name)
-    return injectables
-
-
-def filter_by_group(
-    matches: Set[Injectable],
-    group: str = None,
-    exclude_groups: Sequence[str] = None,
-) -> Set[Injectable]:
-    matches = _filter_by_container_groups(matches)
-    matches = _filter_by_group_and_exclude(matches, group, exclude_groups)
 
-    return matches
 
+@lru_cache(maxsize=4096)
+def _get_filtered_injectables(
+    version: int,
+    container_groups: Optional[FrozenSet[str]],
+    dependency_name: str,
+    registry_type: RegistryType,
+    namespace: str,
+    group: Optional[str],
+    exclude_groups: Optional[FrozenSet[str]],
+) -> Tuple[Injectable, ...]:
+    # the container version and groups are part of the cache key so any container
+    # mutation invalidates previously resolved entries
+    if group is not None and (container_groups is None or group in container_groups):
+        # the group index already holds exactly the injectables of the requested group
+        # and container groups filtering can't discard any of them
+        matches = get_namespace_injectables(
+            dependency_name, registry_type, namespace, group
+        )
+        group = None
+        matches_mask = None
+    else:
+        matches = get_namespace_injectables(dependency_name, registry_type, namespace)
+        matches_mask = get_namespace_groups_mask(
+            dependency_name, registry_type, namespace
+        )
+    if not matches:
+        return _EMPTY
+    matches = filter_by_group(matches, group, exclude_groups, matches_mask)
+    return matches or _EMPTY
 
-def _filter_by_container_groups(matches: Set[Injectable]) -> Set[Injectable]:
-    container_groups = InjectionContainer.GROUPS or []
-    if not container_groups or not any(
-        [i for i in matches if i.group in container_groups]
-    ):
-        return matches
-
-    container_matches = {
-        inj for inj in matches if inj.group is None or inj.group in container_groups
-    }
 
-    return container_matches
+def filter_by_group(
+    matches: Collection[Injectable],
+    group: Optional[str] = None,
+    exclude_groups: Optional[Collection[str]] = None,
+    matches_mask: Optional[int] = None,
+) -> Tuple[Injectable, ...]:
+    if len(matches) <= 1:
+        # container groups only discard injectables when some other match belongs
+        # to them, so a lone match is only subject to the group and exclude filters
+        for inj in matches:
+            if (group is None or inj.group == group) and (
+                not exclude_groups or inj.group not in exclude_groups
+            ):
+                return tuple(matches)
+        return _EMPTY
+    container_groups = InjectionContainer.GROUPS
+    if container_groups is not None:
+        if matches_mask is not None:
+            # matches_mask ORs the group bits of all matches, so a single AND tells
+            # whether any of them belongs to the container groups
+            if not matches_mask & get_groups_mask(container_groups):
+                container_groups = None
+        elif not any(inj.group in container_groups for inj in matches):
+            container_groups = None
+    return make_filter(group, exclude_groups, container_groups)(matches)
+
+
+def make_filter(
+    group: Optional[str] = None,
+    exclude_groups: Optional[Collection[str]] = None,
+    container_groups: Optional[FrozenSet[str]] = None,
+) -> Callable[[Collection[Injectable]], Tuple[Injectable, ...]]:
+    return _make_filter(
+        group,
+        frozenset(exclude_groups) if exclude_groups else None,
+        container_groups,
+    )
 
 
-def _filter_by_group_and_exclude(matches, group, exclude_groups):
-    exclude = exclude_groups or []
-    return {
-        inj
-        for inj in matches
-        if (group is None or inj.group == group) and inj.group not in exclude
-    }
+@lru_cache(maxsize=256)
+def _make_filter(
+    group: Optional[str],
+    exclude: Optional[FrozenSet[str]],
+    container_groups: Optional[FrozenSet[str]],
+) -> Callable[[Collection[Injectable]], Tuple[Injectable, ...]]:
+    if container_groups is not None:
+        return lambda matches: tuple(
+            inj
+            for inj in matches
+            if (inj.group is None or inj.group in container_groups)
+            and (group is None or inj.group == group)
+            and (exclude is None or inj.group not in exclude)
+        )
+    if group is None and exclude is None:
+        return tuple
+    if exclude is None:
+        return lambda matches: tuple(inj for inj in matches if inj.group == group)
+    if group is None:
+        return lambda matches: tuple(inj for inj in matches if inj.group not in exclude)
+    return lambda matches: tuple(
+        inj for inj in matches if inj.group == group and inj.group not in exclude
+    )
 
 
 def resolve_single_injectable(
-    dependency_name: str, registry_type: RegistryType, matches: Set[Injectable]
+    dependency_name: str,
+    registry_type: RegistryType,
+    matches: Sequence[Injectable],
 ) -> Injectable:
     if len(matches) == 1:
-        for injectable in matches:
-            return injectable
-
-    primary_matches = [inj for inj in matches if inj.primary]
-    if len(primary_matches) != 1:
-        raise InjectionError(registry_type.value, dependency_name, matches)
-    return primary_matches[0]
+        return matches[0]
+
+    primary_match = None
+    primary_count = 0
+    for inj in matches:
+        if inj.primary:
+            primary_count += 1
+            if primary_count > 1:
+                break
+            primary_match = inj
+    if primary_match is None or primary_count > 1:
+        raise InjectionError(registry_type, dependency_name, matches)
+    return primary_match
@@ -27,9 +27,14 @@ def clear_injectables(
     namespace = InjectionContainer.NAMESPACES[namespace or DEFAULT_NAMESPACE]
     if isinstance(dependency, str):
         injectables = namespace.qualifier_registry[dependency]
-        namespace.qualifier_registry[dependency] = set()
+        namespace.qualifier_registry[dependency] = {}
+        namespace.qualifier_group_registry.pop(dependency, None)
+        namespace.qualifier_groups_mask.pop(dependency, None)
     else:
         dependency_name = get_dependency_name(dependency)
         injectables = namespace.class_registry[dependency_name]
-        namespace.class_registry[dependency_name] = set()
-    return injectables
+        namespace.class_registry[dependency_name] = {}
+        namespace.class_group_registry.pop(dependency_name, None)
+        namespace.class_groups_mask.pop(dependency_name, None)
+    InjectionContainer._VERSION += 1
+    return set(injectables)
@@ -54,3 +54,4 @@ def register_injectables(
     namespace = InjectionContainer._get_namespace_entry(namespace)
     for injectable in injectables:
         namespace.register_injectable(injectable, klass, qualifier, propagate)
+    InjectionContainer._VERSION += 1
@@ -1,4 +1,5 @@
 from injectable import InjectionContainer
+from injectable.injection.injection_utils import clear_injection_caches
 
 
 def reset_injection_container():
@@ -17,3 +18,5 @@ def reset_injection_container():
     InjectionContainer.LOADED_FILEPATHS = set()
     InjectionContainer.LOADING_DEFAULT_NAMESPACE = None
     InjectionContainer.LOADING_FILEPATH = None
+    InjectionContainer._VERSION += 1
+    clear_injection_caches()
@@ -1,8 +1,17 @@
 import pytest
 from testfixtures import LogCapture
 
+from injectable.testing import reset_injection_container
+
 
 @pytest.fixture(autouse=True)
 def log_capture():
     with LogCapture() as capture:
         yield capture
+
+
+@pytest.fixture(autouse=True)
+def reset_container():
+    reset_injection_container()
+    yield
+    reset_injection_container()
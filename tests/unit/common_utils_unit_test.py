@@ -1,3 +1,5 @@
+import os
+
 from injectable.common_utils import get_dependency_name, get_caller_filepath
 
 
@@ -12,6 +14,38 @@ class TestGetCallerFilepath:
         # then
         assert filepath == expected
 
+    def test__get_caller_filepath__with_default_steps_back(self):
+        # given
+        expected = __file__
+
+        def caller():
+            return get_caller_filepath()
+
+        # when
+        filepath = caller()
+
+        # then
+        assert filepath == expected
+
+    def test__get_caller_filepath__with_relative_filename_after_chdir(
+        self, tmp_path, monkeypatch
+    ):
+        # given
+        code = compile("get_caller_filepath(steps_back=1)", "file.py", "eval")
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        monkeypatch.chdir(first_dir)
+        eval(code)
+
+        # when
+        monkeypatch.chdir(second_dir)
+        filepath = eval(code)
+
+        # then
+        assert filepath == os.path.join(os.getcwd(), "file.py")
+
 
 class TestGetDependencyName:
     def test__get_dependency_name__using_class(self):
@@ -1,10 +1,12 @@
 import os
+import sys
 from unittest.mock import MagicMock
 
 import pytest
 from pytest import fixture
 from pytest_mock import MockFixture
 
+from injectable import inject, inject_multiple
 from injectable.container.injection_container import InjectionContainer
 from injectable.container.namespace import Namespace
 from injectable.constants import DEFAULT_NAMESPACE
@@ -413,6 +415,7 @@ class TestInjectionContainer:
 
         # then
         assert len(InjectionContainer.GROUPS) == 2
+        assert InjectionContainer.GROUPS == frozenset({"group1", "group2"})
 
     def test__register_injectable__with_defaults(self, patch_injection_container):
         # given
@@ -484,6 +487,92 @@ class TestInjectionContainer:
         assert klass_arg is klass
         assert qualifier_arg is qualifier
 
+    def test__register_injectable__interns_group(self, patch_injection_container):
+        # given
+        klass = TestInjectionContainer
+        filepath = os.path.join("fake", "path", "file.py")
+        group = "".join(["GRO", "UP"])
+        InjectionContainer.LOADING_DEFAULT_NAMESPACE = DEFAULT_NAMESPACE
+        mocked_namespace: Namespace = MagicMock(spec=Namespace)
+        patch_injection_container(
+            "Namespace",
+            return_value=mocked_namespace,
+        )
+
+        # when
+        InjectionContainer._register_injectable(klass, filepath, group=group)
+
+        # then
+        injectable_arg = mocked_namespace.register_injectable.call_args[0][0]
+        assert injectable_arg.group is sys.intern("GROUP")
+
+    def test__register_injectable__invalidates_previous_injection_results(self):
+        # given
+        class Foo: ...
+
+        InjectionContainer._get_namespace_entry(DEFAULT_NAMESPACE)
+        assert inject(Foo, optional=True) is None
+
+        # when
+        InjectionContainer._register_injectable(
+            Foo, os.path.join("fake", "path", "foo.py"), namespace=DEFAULT_NAMESPACE
+        )
+
+        # then
+        assert isinstance(inject(Foo, optional=True), Foo)
+
+    def test__register_factory__invalidates_previous_injection_results(self):
+        # given
+        class Foo: ...
+
+        InjectionContainer._get_namespace_entry(DEFAULT_NAMESPACE)
+        assert inject(Foo, optional=True) is None
+
+        # when
+        InjectionContainer._register_factory(
+            Foo,
+            os.path.join("fake", "path", "foo.py"),
+            Foo,
+            namespace=DEFAULT_NAMESPACE,
+        )
+
+        # then
+        assert isinstance(inject(Foo, optional=True), Foo)
+
+    def test__register_injectable__honours_directly_assigned_container_groups(
+        self, mocker: MockFixture
+    ):
+        # given
+        class Bar: ...
+
+        filepath = os.path.join("fake", "path", "bar.py")
+        for group in ("A", "B", None):
+            InjectionContainer._register_injectable(
+                Bar, filepath, namespace=DEFAULT_NAMESPACE, group=group
+            )
+
+        # when
+        mocker.patch.object(InjectionContainer, "GROUPS", frozenset({"A"}))
+        matches = inject_multiple(Bar)
+
+        # then
+        assert len(matches) == 2
+
+    def test__register_injectable__keeps_empty_group(self):
+        # given
+        class Foo: ...
+
+        # when
+        InjectionContainer._register_injectable(
+            Foo,
+            os.path.join("fake", "path", "foo.py"),
+            namespace=DEFAULT_NAMESPACE,
+            group="",
+        )
+
+        # then
+        assert len(inject_multiple(Foo, group="")) == 1
+
     def test__register_factory__for_class_with_defaults(
         self, patch_injection_container
     ):
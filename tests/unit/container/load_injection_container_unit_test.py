@@ -1,4 +1,5 @@
 import os
+import sys
 
 from pytest import fixture
 from pytest_mock import MockFixture
@@ -109,3 +110,18 @@ class TestLoadInjectionContainer:
         assert load.called is True
         group_name_arg = load.call_args[0][2]
         assert group_name_arg == [group_name]
+
+    def test__load_injection_container__interns_groups(
+        self, get_caller_filepath_mock, injection_container_mock
+    ):
+        # given
+        get_caller_filepath_mock.return_value = os.path.join("fake", "path", "file.py")
+        group_name = "".join(["group", "_", "name"])
+
+        # when
+        load_injection_container(groups=[group_name])
+
+        # then
+        load = injection_container_mock.load_dependencies_from
+        group_name_arg = load.call_args[0][2]
+        assert group_name_arg[0] is sys.intern("group_name")
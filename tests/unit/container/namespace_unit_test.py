@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock
 
 from injectable import Injectable
-from injectable.container.namespace import Namespace
+from injectable.container.namespace import Namespace, get_group_bit, get_groups_mask
 
 
 class TestNamespace:
@@ -12,6 +12,10 @@ class TestNamespace:
         # then
         assert namespace.class_registry == {}
         assert namespace.qualifier_registry == {}
+        assert namespace.class_group_registry == {}
+        assert namespace.qualifier_group_registry == {}
+        assert namespace.class_groups_mask == {}
+        assert namespace.qualifier_groups_mask == {}
 
     def test__register_injectable__with_class_only(self):
         # given
@@ -24,7 +28,7 @@ class TestNamespace:
         namespace.register_injectable(injectable, klass)
 
         # then
-        assert namespace.class_registry[class_lookup_key] == {injectable}
+        assert namespace.class_registry[class_lookup_key] == {injectable: None}
 
     def test__register_injectable__with_qualifier_only(self):
         # given
@@ -36,7 +40,7 @@ class TestNamespace:
         namespace.register_injectable(injectable, qualifier=qualifier)
 
         # then
-        assert namespace.qualifier_registry[qualifier] == {injectable}
+        assert namespace.qualifier_registry[qualifier] == {injectable: None}
 
     def test__register_injectable__with_class_and_qualifier(self):
         # given
@@ -50,8 +54,8 @@ class TestNamespace:
         namespace.register_injectable(injectable, klass, qualifier)
 
         # then
-        assert namespace.class_registry[class_lookup_key] == {injectable}
-        assert namespace.qualifier_registry[qualifier] == {injectable}
+        assert namespace.class_registry[class_lookup_key] == {injectable: None}
+        assert namespace.qualifier_registry[qualifier] == {injectable: None}
 
     def test__register_injectable__propagation_to_base_classes(self):
         # given
@@ -69,8 +73,8 @@ class TestNamespace:
         namespace.register_injectable(injectable, child_class)
 
         # then
-        assert namespace.class_registry[child_class_lookup_key] == {injectable}
-        assert namespace.class_registry[base_class_lookup_key] == {injectable}
+        assert namespace.class_registry[child_class_lookup_key] == {injectable: None}
+        assert namespace.class_registry[base_class_lookup_key] == {injectable: None}
 
     def test__register_injectable__with_propagation_disabled(self):
         # given
@@ -88,9 +92,23 @@ class TestNamespace:
         namespace.register_injectable(injectable, child_class, propagate=False)
 
         # then
-        assert namespace.class_registry[child_class_lookup_key] == {injectable}
+        assert namespace.class_registry[child_class_lookup_key] == {injectable: None}
         assert base_class_lookup_key not in namespace.class_registry
 
+    def test__register_injectable__does_not_register_duplicates(self):
+        # given
+        injectable = Injectable(MagicMock, "TEST_ID")
+        klass = TestNamespace
+        class_lookup_key = klass.__qualname__
+        namespace = Namespace()
+        namespace.register_injectable(injectable, klass)
+
+        # when
+        namespace.register_injectable(Injectable(MagicMock, "TEST_ID"), klass)
+
+        # then
+        assert namespace.class_registry[class_lookup_key] == {injectable: None}
+
     def test__register_injectable__class_and_qualifier_overloading(self):
         # given
         injectable = MagicMock(spec=Injectable)
@@ -105,11 +123,67 @@ class TestNamespace:
         namespace.register_injectable(overloading_injectable, klass, qualifier)
 
         # then
-        assert namespace.class_registry[class_lookup_key] == {
+        assert list(namespace.class_registry[class_lookup_key]) == [
             injectable,
             overloading_injectable,
-        }
-        assert namespace.qualifier_registry[qualifier] == {
+        ]
+        assert list(namespace.qualifier_registry[qualifier]) == [
             injectable,
             overloading_injectable,
+        ]
+
+    def test__register_injectable__indexes_injectables_by_group(self):
+        # given
+        injectable_a = MagicMock(spec=Injectable, group="A")
+        injectable_b = MagicMock(spec=Injectable, group="B")
+        injectable_no_group = MagicMock(spec=Injectable, group=None)
+        klass = TestNamespace
+        class_lookup_key = klass.__qualname__
+        qualifier = "qualifier"
+        namespace = Namespace()
+
+        # when
+        for injectable in (injectable_a, injectable_b, injectable_no_group):
+            namespace.register_injectable(injectable, klass, qualifier)
+
+        # then
+        expected_index = {
+            "A": {injectable_a: None},
+            "B": {injectable_b: None},
+            None: {injectable_no_group: None},
         }
+        assert namespace.class_group_registry[class_lookup_key] == expected_index
+        assert namespace.qualifier_group_registry[qualifier] == expected_index
+        expected_mask = get_group_bit("A") | get_group_bit("B")
+        assert namespace.class_groups_mask[class_lookup_key] == expected_mask
+        assert namespace.qualifier_groups_mask[qualifier] == expected_mask
+
+
+class TestGetGroupBit:
+    def test__get_group_bit__when_group_is_none(self):
+        # then
+        assert get_group_bit(None) == 0
+
+    def test__get_group_bit__assigns_one_distinct_bit_per_group(self):
+        # when
+        bit = get_group_bit("TEST_GROUP_BIT")
+
+        # then
+        assert bit & (bit - 1) == 0
+        assert get_group_bit("TEST_GROUP_BIT") == bit
+        assert get_group_bit("OTHER_TEST_GROUP_BIT") != bit
+
+
+class TestGetGroupsMask:
+    def test__get_groups_mask(self):
+        # when
+        mask = get_groups_mask(frozenset(["TEST_GROUP_BIT", "OTHER_TEST_GROUP_BIT"]))
+
+        # then
+        assert mask == get_group_bit("TEST_GROUP_BIT") | get_group_bit(
+            "OTHER_TEST_GROUP_BIT"
+        )
+
+    def test__get_groups_mask__with_no_groups(self):
+        # then
+        assert get_groups_mask(frozenset()) == 0
@@ -1,16 +1,22 @@
+from dataclasses import dataclass
+from typing import Optional
 from unittest.mock import MagicMock
 
 import pytest
 from pytest import fixture
 from pytest_mock import MockFixture
+from testfixtures import LogCapture
 
 from injectable import InjectionContainer, Injectable
-from injectable.container.namespace import Namespace
+from injectable.container.namespace import Namespace, get_group_bit
 from injectable.errors import InjectionError
 from injectable.injection.injection_utils import (
+    clear_injection_caches,
     get_namespace_injectables,
+    get_filtered_injectables,
     RegistryType,
     filter_by_group,
+    make_filter,
     resolve_single_injectable,
 )
 
@@ -20,17 +26,28 @@ def injection_container_mock(mocker: MockFixture):
     return mocker.patch("injectable.injection.injection_utils.InjectionContainer")
 
 
+@dataclass(frozen=True, eq=False)
+class _InjStub:
+    group: Optional[str]
+
+
+@fixture(scope="module")
+def stubs():
+    return _InjStub("A"), _InjStub("A"), _InjStub("B")
+
+
 class TestGetNamespaceInjectables:
-    @pytest.mark.parametrize(
-        "registry_type", (RegistryType.CLASS, RegistryType.QUALIFIER)
-    )
+    @pytest.mark.parametrize("registry_type", ("class", "qualifier"))
     def test__get_namespace_injectables(
         self, registry_type: RegistryType, injection_container_mock: InjectionContainer
     ):
         # given
         dependency_name = "TEST"
         namespace_key = "TEST_NAMESPACE"
+        injectable = MagicMock()
         namespace = MagicMock(spec=Namespace)()
+        namespace.class_registry.get.return_value = {injectable: None}
+        namespace.qualifier_registry.get.return_value = {injectable: None}
         injection_container_mock.NAMESPACES = {namespace_key: namespace}
 
         # when
@@ -39,207 +56,581 @@ class TestGetNamespaceInjectables:
         )
 
         # then
-        assert namespace.class_registry.get.called == (
-            registry_type is RegistryType.CLASS
-        )
-        assert namespace.qualifier_registry.get.called == (
-            registry_type is RegistryType.QUALIFIER
-        )
+        assert namespace.class_registry.get.called == (registry_type == "class")
+        assert namespace.qualifier_registry.get.called == (registry_type == "qualifier")
         registry = (
             namespace.class_registry
-            if registry_type is RegistryType.CLASS
+            if registry_type == "class"
             else namespace.qualifier_registry
         )
         assert registry.get.call_args[0][0] is dependency_name
-        assert injectables == registry.get.return_value
+        assert injectables == (injectable,)
+
+    @pytest.mark.parametrize("registry_type", ("class", "qualifier"))
+    def test__get_namespace_injectables__with_group(
+        self, registry_type: RegistryType, injection_container_mock: InjectionContainer
+    ):
+        # given
+        dependency_name = "TEST"
+        namespace_key = "TEST_NAMESPACE"
+        injectable = MagicMock(group="A")
+        namespace = Namespace()
+        group_registry = (
+            namespace.class_group_registry
+            if registry_type == "class"
+            else namespace.qualifier_group_registry
+        )
+        group_registry[dependency_name] = {"A": {injectable: None}, "B": {}}
+        injection_container_mock.NAMESPACES = {namespace_key: namespace}
+
+        # when
+        injectables = get_namespace_injectables(
+            dependency_name, registry_type, namespace_key, "A"
+        )
+
+        # then
+        assert injectables == (injectable,)
+
+    def test__get_namespace_injectables__when_namespace_is_missing(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock.NAMESPACES = {"OTHER_NAMESPACE": Namespace()}
+
+        # when
+        injectables = get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # then
+        assert injectables == ()
+
+    def test__get_namespace_injectables__warns_once_when_container_is_empty(
+        self,
+        mocker: MockFixture,
+        injection_container_mock: InjectionContainer,
+        log_capture: LogCapture,
+    ):
+        # given
+        mocker.patch(
+            "injectable.injection.injection_utils._EMPTY_CONTAINER_WARNED", False
+        )
+        injection_container_mock.NAMESPACES = {}
+
+        # when
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # then
+        assert len(log_capture.records) == 1
+        assert log_capture.records[0].levelname == "WARNING"
+
+    def test__get_namespace_injectables__reuses_namespace_for_same_version(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        namespaces = MagicMock()
+        namespaces.get.return_value = Namespace()
+        injection_container_mock.NAMESPACES = namespaces
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # when
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+        injection_container_mock._VERSION = 2
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # then
+        assert namespaces.get.call_count == 2
+
+    def test__get_namespace_injectables__finds_namespace_created_after_miss(self):
+        # given
+        injectable = Injectable(MagicMock, "TEST@/fake/path/file.py")
+        assert get_namespace_injectables("TEST", "qualifier", "TEST_NAMESPACE") == ()
+
+        # when
+        namespace = InjectionContainer._get_namespace_entry("TEST_NAMESPACE")
+        namespace.register_injectable(injectable, qualifier="TEST")
+
+        # then
+        injectables = get_namespace_injectables("TEST", "qualifier", "TEST_NAMESPACE")
+        assert injectables == (injectable,)
+
+
+class TestClearInjectionCaches:
+    def test__clear_injection_caches__warns_again_when_container_is_empty(
+        self,
+        mocker: MockFixture,
+        injection_container_mock: InjectionContainer,
+        log_capture: LogCapture,
+    ):
+        # given
+        mocker.patch(
+            "injectable.injection.injection_utils._EMPTY_CONTAINER_WARNED", False
+        )
+        injection_container_mock.NAMESPACES = {}
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # when
+        clear_injection_caches()
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # then
+        assert len(log_capture.records) == 2
+
+    def test__clear_injection_caches__forgets_resolved_namespace(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        namespaces = MagicMock()
+        namespaces.get.return_value = Namespace()
+        injection_container_mock.NAMESPACES = namespaces
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # when
+        clear_injection_caches()
+        get_namespace_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # then
+        assert namespaces.get.call_count == 2
+
+    def test__clear_injection_caches__forgets_filtered_injectables(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        injection_container_mock.GROUPS = None
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": Namespace()}
+        assert get_filtered_injectables("TEST", "qualifier", "TEST_NAMESPACE") == ()
+        injectable = MagicMock(group=None)
+        namespace = Namespace()
+        namespace.register_injectable(injectable, qualifier="TEST")
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+
+        # when
+        clear_injection_caches()
+        matches = get_filtered_injectables("TEST", "qualifier", "TEST_NAMESPACE")
+
+        # then
+        assert matches == (injectable,)
+
+
+class TestGetFilteredInjectables:
+    def test__get_filtered_injectables__caches_results_per_container_version(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        injection_container_mock.GROUPS = None
+        injectables = {MagicMock(group="A"), MagicMock(group="B")}
+        namespace = MagicMock(spec=Namespace)()
+        namespace.class_registry.get.return_value = injectables
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+
+        # when
+        first = get_filtered_injectables(
+            "TEST", "class", "TEST_NAMESPACE", exclude_groups=["B"]
+        )
+        second = get_filtered_injectables(
+            "TEST", "class", "TEST_NAMESPACE", exclude_groups=["B"]
+        )
+
+        # then
+        assert namespace.class_registry.get.call_count == 1
+        assert first is second
+        assert isinstance(first, tuple)
+        assert len(first) == 1
+
+    def test__get_filtered_injectables__when_container_version_changes(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        injection_container_mock.GROUPS = None
+        namespace = MagicMock(spec=Namespace)()
+        namespace.class_registry.get.return_value = {MagicMock(group=None)}
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+        get_filtered_injectables("TEST", "class", "TEST_NAMESPACE")
+        injection_container_mock._VERSION = 2
+
+        # when
+        get_filtered_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # then
+        assert namespace.class_registry.get.call_count == 2
+
+    def test__get_filtered_injectables__when_there_are_no_matches(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        injection_container_mock.NAMESPACES = {}
+
+        # when
+        matches = get_filtered_injectables("TEST", "class", "TEST_NAMESPACE")
+
+        # then
+        assert matches == ()
+
+    def test__get_filtered_injectables__with_group_uses_group_index(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        injection_container_mock.GROUPS = None
+        injectable_a = MagicMock(group="A")
+        namespace = Namespace()
+        namespace.class_registry["TEST"] = {
+            injectable_a: None,
+            MagicMock(group="B"): None,
+        }
+        namespace.class_group_registry["TEST"] = {"A": {injectable_a: None}}
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+
+        # when
+        matches = get_filtered_injectables("TEST", "class", "TEST_NAMESPACE", group="A")
+
+        # then
+        assert matches == (injectable_a,)
+
+    def test__get_filtered_injectables__when_group_is_outside_container_groups(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        injection_container_mock.GROUPS = frozenset(["B"])
+        namespace = Namespace()
+        namespace.register_injectable(MagicMock(group="A"), qualifier="TEST")
+        namespace.register_injectable(MagicMock(group="B"), qualifier="TEST")
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+
+        # when
+        matches = get_filtered_injectables(
+            "TEST", "qualifier", "TEST_NAMESPACE", group="A"
+        )
+
+        # then
+        assert len(matches) == 0
+
+    def test__get_filtered_injectables__when_exclude_groups_contains_none(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        injection_container_mock.GROUPS = None
+        injectable_b = MagicMock(group="B")
+        namespace = Namespace()
+        namespace.register_injectable(MagicMock(group=None), qualifier="TEST")
+        namespace.register_injectable(MagicMock(group="A"), qualifier="TEST")
+        namespace.register_injectable(injectable_b, qualifier="TEST")
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+
+        # when
+        matches = get_filtered_injectables(
+            "TEST", "qualifier", "TEST_NAMESPACE", exclude_groups=[None, "A"]
+        )
+
+        # then
+        assert matches == (injectable_b,)
+
+    def test__get_filtered_injectables__when_container_groups_change(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock._VERSION = 1
+        injection_container_mock.GROUPS = None
+        namespace = Namespace()
+        namespace.register_injectable(MagicMock(group="A"), qualifier="TEST")
+        namespace.register_injectable(MagicMock(group="B"), qualifier="TEST")
+        injection_container_mock.NAMESPACES = {"TEST_NAMESPACE": namespace}
+        assert len(get_filtered_injectables("TEST", "qualifier", "TEST_NAMESPACE")) == 2
+
+        # when
+        injection_container_mock.GROUPS = frozenset(["A"])
+        matches = get_filtered_injectables("TEST", "qualifier", "TEST_NAMESPACE")
+
+        # then
+        assert len(matches) == 1
 
 
 class TestFilterByGroup:
     def test__filter_by_group__when_exclude_groups_is_none_and_container_groups_is_none(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
         injection_container_mock.GROUPS = None
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
 
         # when
-        matches = filter_by_group({*injectables}, group="A", exclude_groups=None)
+        matches = filter_by_group({*stubs}, group="A", exclude_groups=None)
 
         # then
         assert len(matches) == 2
-        assert all(match in injectables[:2] for match in matches)
+        assert all(match in stubs[:2] for match in matches)
 
     def test__filter_by_group__when_group_is_none_and_container_groups_is_none(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
         injection_container_mock.GROUPS = None
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
 
         # when
-        matches = filter_by_group({*injectables}, exclude_groups=["B"])
+        matches = filter_by_group({*stubs}, exclude_groups=["B"])
 
         # then
         assert len(matches) == 2
-        assert all(match in injectables[:2] for match in matches)
+        assert all(match in stubs[:2] for match in matches)
 
     def test__filter_by_group__when_group_and_exclude_groups_are_set_and_container_groups_is_none(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
         injection_container_mock.GROUPS = None
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
 
         # when
-        matches = filter_by_group({*injectables}, group="A", exclude_groups=["A"])
+        matches = filter_by_group({*stubs}, group="A", exclude_groups=["A"])
 
         # then
         assert len(matches) == 0
 
     def test__filter_by_group__when_exclude_groups_is_none_and_container_groups_is_set(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
-        injection_container_mock.GROUPS = ["A"]
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injection_container_mock.GROUPS = frozenset(["A"])
 
         # when
-        matches = filter_by_group({*injectables}, group="A")
+        matches = filter_by_group({*stubs}, group="A")
 
         # then
         assert len(matches) == 2
-        assert all(match in injectables[:2] for match in matches)
+        assert all(match in stubs[:2] for match in matches)
 
     def test__filter_by_group__when_group_is_none_and_container_groups_is_set(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
-        injection_container_mock.GROUPS = ["A"]
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injection_container_mock.GROUPS = frozenset(["A"])
 
         # when
-        matches = filter_by_group({*injectables})
+        matches = filter_by_group({*stubs})
 
         # then
         assert len(matches) == 2
 
     def test__filter_by_group__when_group_conflicts_with_container_groups(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
-        injection_container_mock.GROUPS = ["B"]
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injection_container_mock.GROUPS = frozenset(["B"])
 
         # when
-        matches = filter_by_group({*injectables}, group="A")
+        matches = filter_by_group({*stubs}, group="A")
 
         # then
         assert len(matches) == 0
 
     def test__filter_by_group__when_group_is_none_and_exclude_groups_and_container_groups_are_set(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
-        injection_container_mock.GROUPS = ["A"]
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injection_container_mock.GROUPS = frozenset(["A"])
 
         # when
-        matches = filter_by_group({*injectables}, exclude_groups=["B"])
+        matches = filter_by_group({*stubs}, exclude_groups=["B"])
 
         # then
         assert len(matches) == 2
-        assert all(match in injectables[:2] for match in matches)
+        assert all(match in stubs[:2] for match in matches)
 
     def test__filter_by_group__when_group_and_exclude_groups_and_container_groups_are_all_set(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
-        injection_container_mock.GROUPS = ["B"]
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injection_container_mock.GROUPS = frozenset(["B"])
 
         # when
-        matches = filter_by_group({*injectables}, group="A", exclude_groups=["A"])
+        matches = filter_by_group({*stubs}, group="A", exclude_groups=["A"])
 
         # then
         assert len(matches) == 0
 
     def test__filter_by_group__when_all_parameters_are_none(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
         injection_container_mock.GROUPS = None
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
 
         # when
-        matches = filter_by_group({*injectables})
+        matches = filter_by_group({*stubs})
 
         # then
         assert len(matches) == 3
-        assert all(match in injectables for match in matches)
+        assert all(match in stubs for match in matches)
 
     def test__filter_by_group__when_container_groups_allows_all_injectables(
-        self, injection_container_mock: InjectionContainer
+        self, injection_container_mock: InjectionContainer, stubs
     ):
         # given
-        injection_container_mock.GROUPS = ["A", "B"]
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injection_container_mock.GROUPS = frozenset(["A", "B"])
 
         # when
-        matches = filter_by_group({*injectables})
+        matches = filter_by_group({*stubs})
 
         # then
         assert len(matches) == 3
-        assert all(match in injectables for match in matches)
+        assert all(match in stubs for match in matches)
 
-    def test__filter_by_group__when_exclude_groups_excludes_all_injectables(self):
+    def test__filter_by_group__when_exclude_groups_excludes_all_injectables(
+        self, stubs
+    ):
+        # when
+        matches = filter_by_group({*stubs}, exclude_groups=["A", "B"])
+
+        # then
+        assert len(matches) == 0
+
+    def test__filter_by_group__when_matches_mask_misses_container_groups(
+        self, injection_container_mock: InjectionContainer
+    ):
         # given
-        injectables = [MagicMock(group="A"), MagicMock(group="A"), MagicMock(group="B")]
+        injection_container_mock.GROUPS = frozenset(["C"])
+        injectables = {MagicMock(group="A"), MagicMock(group="B")}
+        matches_mask = get_group_bit("A") | get_group_bit("B")
 
         # when
-        matches = filter_by_group({*injectables}, exclude_groups=["A", "B"])
+        matches = filter_by_group(injectables, matches_mask=matches_mask)
 
         # then
-        assert len(matches) == 0
+        assert set(matches) == injectables
+
+    def test__filter_by_group__when_matches_mask_hits_container_groups(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock.GROUPS = frozenset(["A"])
+        injectable_a = MagicMock(group="A")
+        injectables = {injectable_a, MagicMock(group="B")}
+        matches_mask = get_group_bit("A") | get_group_bit("B")
+
+        # when
+        matches = filter_by_group(injectables, matches_mask=matches_mask)
+
+        # then
+        assert matches == (injectable_a,)
+
+    def test__filter_by_group__when_single_match_is_outside_container_groups(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock.GROUPS = frozenset(["B"])
+        injectable = MagicMock(group="A")
+
+        # when
+        matches = filter_by_group((injectable,))
+
+        # then
+        assert matches == (injectable,)
+
+    def test__filter_by_group__when_single_match_is_excluded(
+        self, injection_container_mock: InjectionContainer
+    ):
+        # given
+        injection_container_mock.GROUPS = None
+
+        # when
+        matches = filter_by_group((MagicMock(group="A"),), exclude_groups=["A"])
+
+        # then
+        assert matches == ()
+
+    def test__filter_by_group__when_there_are_no_matches(self):
+        # when
+        matches = filter_by_group((), group="A")
+
+        # then
+        assert matches == ()
+
+
+class TestMakeFilter:
+    def test__make_filter__when_group_and_exclude_groups_are_none(self):
+        # given
+        injectables = {MagicMock(group="A"), MagicMock(group="B")}
+
+        # when
+        matches = make_filter()(injectables)
+
+        # then
+        assert set(matches) == injectables
+
+    def test__make_filter__with_group_and_exclude_groups(self):
+        # given
+        injectable_a = MagicMock(group="A")
+        injectables = {injectable_a, MagicMock(group="B"), MagicMock(group=None)}
+
+        # when
+        matches = make_filter("A", ["B"])(injectables)
+
+        # then
+        assert matches == (injectable_a,)
+
+    def test__make_filter__with_container_groups(self):
+        # given
+        injectable_a = MagicMock(group="A")
+        injectable_no_group = MagicMock(group=None)
+        injectables = {injectable_a, injectable_no_group, MagicMock(group="B")}
+
+        # when
+        matches = make_filter(container_groups=frozenset(["A"]))(injectables)
+
+        # then
+        assert set(matches) == {injectable_a, injectable_no_group}
+
+    def test__make_filter__reuses_specialized_filters(self):
+        # when
+        first = make_filter("A", ["B", "C"])
+        second = make_filter("A", ("C", "B"))
+
+        # then
+        assert first is second
 
 
 class TestResolveSingleInjectable:
     def test__resolve_single_injectable__obvious_case(self):
         # given
         expected_injectable = MagicMock(spec=Injectable)()
-        matches = {expected_injectable}
+        matches = (expected_injectable,)
 
         # when
-        injectable = resolve_single_injectable("TEST", RegistryType.CLASS, matches)
+        injectable = resolve_single_injectable("TEST", "class", matches)
 
         # then
         assert injectable == expected_injectable
 
     def test__resolve_single_injectable__when_there_are_no_primary_injectables(self):
         # given
-        matches = {MagicMock(primary=False), MagicMock(primary=False)}
+        matches = (MagicMock(primary=False), MagicMock(primary=False))
 
         # then when
         with pytest.raises(InjectionError):
-            resolve_single_injectable("TEST", RegistryType.CLASS, matches)
+            resolve_single_injectable("TEST", "class", matches)
 
     def test__resolve_single_injectable__when_there_are_multiple_primary_injectables(
         self,
     ):
         # given
-        matches = {MagicMock(primary=True), MagicMock(primary=True)}
+        matches = (MagicMock(primary=True), MagicMock(primary=True))
 
         # then when
         with pytest.raises(InjectionError):
-            resolve_single_injectable("TEST", RegistryType.CLASS, matches)
+            resolve_single_injectable("TEST", "class", matches)
 
     def test__resolve_single_injectable__when_there_are_one_primary_injectables(self):
         # given
         primary_injectable = MagicMock(primary=True)
         non_primary_injectable = MagicMock(primary=False)
-        matches = {primary_injectable, non_primary_injectable}
+        matches = (primary_injectable, non_primary_injectable)
 
         # when
-        injectable = resolve_single_injectable("TEST", RegistryType.CLASS, matches)
+        injectable = resolve_single_injectable("TEST", "class", matches)
 
         # then
         assert injectable is primary_injectable
@@ -32,7 +32,7 @@ def get_dependency_name_mock(mocker: MockFixture):
 class TestClearInjectables:
     def test__clear_injectables__with_class_dependency(self, get_dependency_name_mock):
         # given
-        expected_injectables = [MagicMock(spec=Injectable)()]
+        expected_injectables = {MagicMock(spec=Injectable)(): None}
         namespace_key = "TEST_NAMESPACE"
         namespace = MagicMock(spec=Namespace)()
         namespace.class_registry.__getitem__.return_value = expected_injectables
@@ -46,15 +46,14 @@ class TestClearInjectables:
         # then
         assert call.class_registry.__getitem__(dependency_name) in namespace.mock_calls
         assert (
-            call.class_registry.__setitem__(dependency_name, set())
-            in namespace.mock_calls
+            call.class_registry.__setitem__(dependency_name, {}) in namespace.mock_calls
         )
         assert namespace.qualifier_registry.__getitem__.called is False
-        assert cleared_injectables is expected_injectables
+        assert cleared_injectables == set(expected_injectables)
 
     def test__clear_injectables__with_qualifier_dependency(self):
         # given
-        expected_injectables = [MagicMock(spec=Injectable)()]
+        expected_injectables = {MagicMock(spec=Injectable)(): None}
         namespace_key = "TEST_NAMESPACE"
         namespace = MagicMock(spec=Namespace)()
         namespace.qualifier_registry.__getitem__.return_value = expected_injectables
@@ -67,15 +66,14 @@ class TestClearInjectables:
         # then
         assert call.qualifier_registry.__getitem__(qualifier) in namespace.mock_calls
         assert (
-            call.qualifier_registry.__setitem__(qualifier, set())
-            in namespace.mock_calls
+            call.qualifier_registry.__setitem__(qualifier, {}) in namespace.mock_calls
         )
         assert namespace.class_registry.__getitem__.called is False
-        assert cleared_injectables is expected_injectables
+        assert cleared_injectables == set(expected_injectables)
 
     def test__clear_injectables__with_default_namespace(self):
         # given
-        expected_injectables = [MagicMock(spec=Injectable)()]
+        expected_injectables = {MagicMock(spec=Injectable)(): None}
         default_namespace_key = DEFAULT_NAMESPACE
         namespace = MagicMock(spec=Namespace)()
         namespace.qualifier_registry.__getitem__.return_value = expected_injectables
@@ -88,8 +86,7 @@ class TestClearInjectables:
         # then
         assert call.qualifier_registry.__getitem__(qualifier) in namespace.mock_calls
         assert (
-            call.qualifier_registry.__setitem__(qualifier, set())
-            in namespace.mock_calls
+            call.qualifier_registry.__setitem__(qualifier, {}) in namespace.mock_calls
         )
         assert namespace.class_registry.__getitem__.called is False
-        assert cleared_injectables is expected_injectables
+        assert cleared_injectables == set(expected_injectables)
@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, call
 
 import pytest
+from pytest_mock import MockFixture
 
 from injectable import InjectionContainer, Injectable
 from injectable.constants import DEFAULT_NAMESPACE
@@ -75,11 +76,15 @@ class TestRegisterInjectables:
             for inj in injectables
         )
 
-    def test__register_injectables__with_empty_injection_container(self):
+    def test__register_injectables__with_empty_injection_container(
+        self, mocker: MockFixture
+    ):
         # given
         InjectionContainer.NAMESPACES = {}
         namespace = MagicMock(spec=Namespace)()
-        InjectionContainer._get_namespace_entry = MagicMock(return_value=namespace)
+        mocker.patch.object(
+            InjectionContainer, "_get_namespace_entry", return_value=namespace
+        )
         injectables = [MagicMock(spec=Injectable)(), MagicMock(spec=Injectable)()]
         klass = MagicMock
         qualifier = "TEST"
@@ -1,7 +1,11 @@
 import os
 
+from pytest_mock import MockFixture
+
 from injectable import InjectionContainer
+from injectable.common_utils import get_dependency_name
 from injectable.container.namespace import Namespace
+from injectable.injection.injection_utils import get_namespace_injectables
 from injectable.testing import reset_injection_container
 
 
@@ -30,3 +34,28 @@ class TestResetInjectionContainer:
         assert InjectionContainer.LOADED_FILEPATHS == set()
         assert InjectionContainer.LOADING_DEFAULT_NAMESPACE is None
         assert InjectionContainer.LOADING_FILEPATH is None
+
+    def test__reset_injection_container__clears_injection_caches(
+        self, mocker: MockFixture
+    ):
+        # given
+        class Foo: ...
+
+        InjectionContainer._register_injectable(
+            Foo, os.path.join("fake", "path", "foo.py"), namespace="TEST_NAMESPACE"
+        )
+        dependency_name = get_dependency_name(Foo)
+        assert get_namespace_injectables(dependency_name, "class", "TEST_NAMESPACE")
+
+        clear_injection_caches = mocker.patch(
+            "injectable.testing.reset_injection_container_util.clear_injection_caches"
+        )
+
+        # when
+        reset_injection_container()
+
+        # then
+        assert clear_injection_caches.called
+        assert (
+            get_namespace_injectables(dependency_name, "class", "TEST_NAMESPACE") == ()
+        )